@@ -54,28 +54,30 @@ class DoMessenger(Messenger):
         self._intervener_id = str(id(self))
 
     def _pyro_sample(self, msg):
-        if (
-            msg.get("_intervener_id", None) != self._intervener_id
-            and self.data.get(msg["name"]) is not None
-        ):
+        name = msg["name"]
+        intervention = self.data.get(name)
+        if intervention is None:
+            return None
 
-            if msg.get("_intervener_id", None) is not None:
+        intervener_id = msg.get("_intervener_id", None)
+        if intervener_id != self._intervener_id:
+
+            if intervener_id is not None:
                 warnings.warn(
                     "Attempting to intervene on variable {} multiple times,"
-                    "this is almost certainly incorrect behavior".format(msg["name"]),
+                    "this is almost certainly incorrect behavior".format(name),
                     RuntimeWarning,
                 )
 
             msg["_intervener_id"] = self._intervener_id
 
             # split node, avoid reapplying self recursively to new node
-            new_msg = msg.copy()
-            new_msg["cond_indep_stack"] = ()  # avoid entering plates twice
+            # and avoid entering plates twice
+            new_msg = {**msg, "cond_indep_stack": ()}
             apply_stack(new_msg)
 
             # apply intervention
-            intervention = self.data[msg["name"]]
-            msg["name"] = msg["name"] + "__CF"  # mangle old name
+            msg["name"] = name + "__CF"  # mangle old name
 
             if isinstance(intervention, (numbers.Number, torch.Tensor)):
                 msg["value"] = intervention
@@ -101,3 +101,40 @@ def test_plate_duplication_smoke():
 
     svi = pyro.infer.SVI(do_model, do_auto, optim, pyro.infer.Trace_ELBO())
     svi.step(len(obs_x))
+
+
+def test_none_intervention_is_ignored():
+    def model():
+        return pyro.sample("x", dist.Normal(0, 1))
+
+    tr = poutine.trace(model)
+    poutine.do(tr, data={"x": None})()
+    tr = tr.trace
+    assert "x__CF" not in tr.nodes
+    assert not tr.nodes["x"]["is_observed"]
+    assert_equal(tr.nodes["x"]["value"], tr.nodes["_RETURN"]["value"])
+
+
+def test_unmatched_site_is_not_split():
+    def model():
+        x = pyro.sample("x", dist.Normal(0, 1))
+        return pyro.sample("y", dist.Normal(x, 1))
+
+    tr = poutine.trace(model)
+    poutine.do(tr, data={"x": 1.0})()
+    tr = tr.trace
+    assert "x__CF" in tr.nodes
+    assert "y__CF" not in tr.nodes
+    assert not tr.nodes["y"]["is_observed"]
+
+
+def test_data_mutated_after_construction():
+    def model():
+        return pyro.sample("x", dist.Normal(0, 1))
+
+    data = {}
+    tr = poutine.trace(model)
+    do_model = poutine.do(tr, data=data)
+    data["x"] = torch.tensor(1.0)
+    assert_equal(do_model(), torch.tensor(1.0))
+    assert "x__CF" in tr.trace.nodes